@@ -3,7 +3,9 @@ Base classes of Spur's component types.
 
 :class:`BaseComponent` defines the abstract base component.
 """
+import inspect
 import logging
+from collections import deque
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, List, Optional
 
@@ -11,24 +13,36 @@ from simpy.core import BoundClass, Environment
 from simpy.resources.resource import Resource, Request, Release
 from simpy.resources.store import Store
 
-from spur.core.exception import NotPositiveError, NotUniqueIDError
+from spur.core.exception import NotPositiveError
+from spur.core.jitter import NoJitter
 
 logger = logging.getLogger(__name__)
+# Default simulation and agent loggers, shared by every item until a child class overrides them
+simLog = logging.getLogger("sim.base")
+agentLog = logging.getLogger("agent")
+# Marks a component argument that `as_dict` could not find on the instance
+_MISSING = object()
 
 
 class StatusException(Exception):
     pass
 
 
-class SimLogFilter(logging.Filter):
+class SimFormatter(logging.Formatter):
+    """Formatter for simulation output.
+
+    Stamps each record with the current model time as `now`, and the last part of
+    the logger name as `shortname`, before formatting it.
+    """
+
     def __init__(self, model, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.model = model
 
-    def filter(self, record) -> bool:
+    def format(self, record) -> str:
         record.now = self.model.now
-        record.name = record.name.split(".")[-1]
-        return True
+        record.shortname = record.name.rpartition(".")[2]
+        return super().format(record)
 
 
 class BaseItem(ABC):
@@ -45,31 +59,22 @@ class BaseItem(ABC):
     """
 
     __name__ = "Base Item"
+    __slots__ = ("_model", "uid", "logger", "simLog")
 
     def __init__(self, model, uid) -> None:
         self._model = model
-        if self._model._uid_unique(uid) == False:
-            raise NotUniqueIDError(f"UID {uid} has been used already.")
+        model._register_uid(uid)
         self.uid = uid
 
         # Set base logging information
-        self.logger = logging.getLogger(f"{logger.name}.{uid}")
+        self.logger = logger
         # Set simulation logging information
-        self.simLog = logging.getLogger("sim.base")
-        self.simLog.debug("I am alive!")
+        self.simLog = simLog
 
     @property
     def model(self):
         return self._model
 
-    @property
-    def uid(self):
-        return self._uid
-
-    @uid.setter
-    def uid(self, uid):
-        self._uid = uid
-
 
 class BaseComponent(BaseItem, ABC):
     """The base component class used for the model.
@@ -90,11 +95,15 @@ class BaseComponent(BaseItem, ABC):
     """
 
     __name__ = "BaseComponent"
+    __slots__ = ("_agents", "_jitter", "_no_jitter", "_collection", "_timeout")
 
     def __init__(self, model, uid, jitter, collection) -> None:
-        self._agents = {}
-        self._jitter = jitter
+        self._agents = set()
+        self.jitter = jitter
         self._collection = collection
+        # The model is fixed for the component's lifetime, so keep its timeout factory at hand
+        # for the do() methods
+        self._timeout = model.timeout
         super().__init__(model, uid)
 
     def __repr__(self):
@@ -111,6 +120,8 @@ class BaseComponent(BaseItem, ABC):
     @jitter.setter
     def jitter(self, j):
         self._jitter = j
+        # do() methods skip the jitter call entirely while it can only return 0
+        self._no_jitter = type(j) is NoJitter
 
     def accept_agent(self, agent):
         """Accept a request for an agent to use the component
@@ -124,10 +135,10 @@ class BaseComponent(BaseItem, ABC):
         if self.collection is not None:
             self.collection.accept_agent(agent)
 
-        self._agents[agent.uid] = agent
+        self._agents.add(agent)
 
-        self.simLog.debug(f"Accepted agent {agent.uid}")
-        self.simLog.debug(f"Current Agents (after accept): {self._agents}")
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Accepted agent %s", agent.uid)
 
     def release_agent(self, agent):
         """Release an agent from the component resource
@@ -146,9 +157,10 @@ class BaseComponent(BaseItem, ABC):
         if self.collection is not None:
             self.collection.release_agent(agent)
 
-        self.simLog.debug(f"Releasing agent {agent.uid}")
-        self.simLog.debug(f"Current Agents (before release): {self._agents}")
-        return self._agents.pop(agent.uid)
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Releasing agent %s", agent.uid)
+        self._agents.remove(agent)
+        return agent
 
     def as_dict(self):
         """Return a dictionary describing the attributes of the component
@@ -159,28 +171,37 @@ class BaseComponent(BaseItem, ABC):
             A dictionary contianing the required keys and values describing the component.
         """
 
-        d = self.__dict__
-        d.pop("_res", None)
-        d.pop("_agents", None)
-        d.pop("simLog", None)
-        d.pop("logger", None)
-        d.pop("_model", None)
-        # Now build a dictionary with what's left
         clean = {
             "type": self.__name__,
-            "uid": d["_uid"],
-            "jitter": d["_jitter"].__name__,
+            "uid": self.uid,
+            "jitter": self._jitter.__name__,
         }
-        mandatory_keys = ["uid", "jitter"]
-        for k in d.keys():
-            clean_k = k.lstrip("_")
-            if clean_k not in mandatory_keys:
-                if "args" not in clean.keys():
-                    clean["args"] = {clean_k: d[k]}
-                else:
-                    clean["args"][clean_k] = d[k]
+        args = {}
+        for attr, key in self._as_dict_keys:
+            # Arguments are stored either as a private attribute or behind a public property
+            value = getattr(self, attr, _MISSING)
+            if value is _MISSING:
+                value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise AttributeError(f"{self.__name__} does not store its {key} argument")
+            args[key] = value
+        if args:
+            clean["args"] = args
         return clean
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Build the (attribute, argument) name pairs used by `as_dict` once per component
+        # type from the arguments of its `__init__`, so that `as_dict` output can be fed
+        # back into `Model.add_components_from_list`
+        skip = ("self", "model", "uid", "jitter", "collection")
+        cls._as_dict_keys = tuple(
+            (f"_{name}", name)
+            for name, param in inspect.signature(cls.__init__).parameters.items()
+            if name not in skip and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        )
+
     def can_accept_agent(self, agent: 'Agent') -> bool:
         """Check whether `agent` is eligible to use this component based on component and
         collection states.
@@ -215,18 +236,30 @@ class BaseComponent(BaseItem, ABC):
 
 class ResourceComponent(BaseComponent):
     __name__ = "Base Resource Component"
+    __slots__ = ("_res",)
 
     def __init__(self, model, uid, resource: 'SpurResource', jitter, collection) -> None:
         self._res = resource
         super().__init__(model, uid, jitter, collection)
 
+        # Outside a collection the default eligibility check always passes, so let the
+        # resource admit on capacity alone
+        resource._check_eligibility = (
+            collection is not None or type(self).can_accept_agent is not BaseComponent.can_accept_agent
+        )
+
     @property
     def resource(self):
         return self._res
 
+    @property
+    def capacity(self):
+        return self._res.capacity
+
 
 class StoreComponent(BaseComponent):
     __name__ = "Store Component"
+    __slots__ = ("_store",)
 
     def __init__(self, model, uid, store: Store, jitter, collection) -> None:
         self._store = store
@@ -268,8 +301,12 @@ class SpurResource(Resource):
 
     users: List[SpurRequest]
 
+    PutQueue = deque
+
     def __init__(self, env: Environment, component: ResourceComponent, capacity: int = 1):
         self._component = component
+        # Whether admission asks the component, set by the component once it is constructed
+        self._check_eligibility = True
         super().__init__(env, capacity)
 
     if TYPE_CHECKING:
@@ -289,27 +326,46 @@ class SpurResource(Resource):
     def _do_put(self, event: SpurRequest) -> None:
         if (
             len(self.users) < self.capacity
-            and self._component.can_accept_agent(event.agent)
+            and (not self._check_eligibility or self._component.can_accept_agent(event.agent))
         ):
             self.users.append(event)
             self._component.accept_agent(event.agent)
             event.usage_since = self._env.now
             event.succeed()
 
+    def _trigger_put(self, get_event) -> None:
+        # _do_put never asks to continue, so only the head of the queue is ever
+        # examined (first come, first served). Pop it off the deque once granted.
+        put_queue = self.put_queue
+        if put_queue:
+            put_event = put_queue[0]
+            self._do_put(put_event)
+            if put_event.triggered:
+                put_queue.popleft()
+
     def process_queue(self) -> None:
         """Explicitly trigger the processing of the wait queue of trains wanting to use the resource,
         instead of only triggering upon a new request or a train releasing the resource.
 
+        Every request that can be admitted is admitted in this one call, in queue order,
+        stopping at the first one that cannot.
+
         Returns
         -------
         None
         """
-
-        self._trigger_put(None)
+        put_queue = self.put_queue
+        while put_queue:
+            put_event = put_queue[0]
+            self._do_put(put_event)
+            if not put_event.triggered:
+                break
+            put_queue.popleft()
 
 
 class Agent(BaseItem, ABC):
     __name__ = "Agent"
+    __slots__ = ("_current_segment", "tour", "_speed", "_max_speed", "agentLog", "action")
 
     def __init__(self, model, uid, tour, max_speed) -> None:
         self._current_segment = None  # The current segment
@@ -317,15 +373,8 @@ class Agent(BaseItem, ABC):
         self.speed = 0
         self.max_speed = max_speed
         super().__init__(model, uid)
-        self.agentLog = logging.getLogger("agent")
-        self.agentLog.setLevel(logging.INFO)
-        # Set up logfile output for agents
-        fh = logging.FileHandler("log/agent.log", mode="w")
-        fh.setLevel(logging.INFO)
-        fh.addFilter(SimLogFilter(model))
-        simFileFormatter = logging.Formatter("%(now)d,%(name)s,%(message)s", style="%")
-        fh.setFormatter(simFileFormatter)
-        self.agentLog.addHandler(fh)
+        # Logfile output for agents is set up once by the model
+        self.agentLog = agentLog
 
     @property
     def speed(self):
@@ -347,14 +396,6 @@ class Agent(BaseItem, ABC):
             raise NotPositiveError("Maximum speed must be positive")
         self._max_speed = max_speed
 
-    @property
-    def tour(self):
-        return self._tour
-
-    @tour.setter
-    def tour(self, tour):
-        self._tour = tour
-
     @property
     def current_segment(self):
         return self._current_segment
@@ -368,7 +409,8 @@ class Agent(BaseItem, ABC):
         self._current_segment.component.accept_agent(self)
 
     def start(self):
-        self.simLog.debug("Started!")
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Started!")
         self.action = self.model.process(self.run())
 
     @abstractmethod
@@ -380,6 +422,7 @@ class BaseCollection(BaseItem, ABC):
     """The base collection class that all collections inherit from."""
 
     __name__ = "BaseCollection"
+    __slots__ = ()
 
     def __init__(self, model, uid) -> None:
         super().__init__(model, uid)
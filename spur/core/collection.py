@@ -1,6 +1,7 @@
 """Contains collections that a component could be associated with."""
 
 import logging
+from collections import deque
 from typing import Optional
 
 from spur.core.base import BaseCollection, Agent
@@ -23,15 +24,16 @@ class BlockExclusiveZone(BaseCollection):
     occupied : bool
         Whether the collection is occupied (i.e. contains a train)
     wait_queue : list[Agent]
-        The wait queue for entry into the collection when the collection is already
-        occupied.
+        A copy of the wait queue for entry into the collection when the collection is
+        already occupied. Use `add_to_wait_queue` and `pop_from_wait_queue` to change it.
     """
 
     __name__ = "BlockExclusiveZone"
 
     def __init__(self, model, uid):
         self._occupied: bool = False
-        self._wait_queue: list[Agent] = []
+        self._wait_queue: deque[Agent] = deque()
+        self._waiting: set = set()  # UIDs of the agents in the wait queue
         super().__init__(model, uid)
 
     @property
@@ -44,10 +46,10 @@ class BlockExclusiveZone(BaseCollection):
 
     @property
     def wait_queue(self) -> list[Agent]:
-        return self._wait_queue
+        return list(self._wait_queue)
 
     def add_to_wait_queue(self, agent) -> None:
-        """Add a train to the wait queue.
+        """Add a train to the wait queue, unless it is already waiting.
 
         Parameters
         ----------
@@ -55,7 +57,10 @@ class BlockExclusiveZone(BaseCollection):
             The train agent object wanting to enter the collection that is to be added
             to the wait queue.
         """
-        self.wait_queue.append(agent)
+        if agent.uid in self._waiting:
+            return
+        self._waiting.add(agent.uid)
+        self._wait_queue.append(agent)
 
     def pop_from_wait_queue(self) -> Optional[Agent]:
         """Pop the train at the head of the wait queue, if exists.
@@ -65,41 +70,36 @@ class BlockExclusiveZone(BaseCollection):
         Optional[Agent]
             The train popped from the head of the queue, otherwise None.
         """
-        if len(self.wait_queue) == 0:
+        if len(self._wait_queue) == 0:
             return None
         else:
-            return self.wait_queue.pop(0)
+            agent = self._wait_queue.popleft()
+            self._waiting.discard(agent.uid)
+            return agent
 
     def can_accept_agent(self, agent: Agent) -> bool:
         # If agent is staying in the same BEZ, accept the agent by default
-        if (
-            agent.current_segment is not None
-            and agent.current_segment.component.collection is not None
-            and agent.current_segment.component.collection.uid == self.uid
-        ):
+        segment = agent.current_segment
+        if segment is not None and segment.collection is self:
             return True
 
         # Otherwise, agent is entering BEZ from the outside
 
-        if agent not in self.wait_queue:
-            self.add_to_wait_queue(agent)
+        self.add_to_wait_queue(agent)
 
-        if not self.occupied and self.wait_queue[0] == agent:
+        if not self.occupied and self._wait_queue[0] == agent:
             return True
         else:
             return False
 
     def accept_agent(self, agent: Agent) -> None:
         # If agent is staying in the same BEZ, do nothing
-        if (
-            agent.current_segment is not None
-            and agent.current_segment.component.collection is not None
-            and agent.current_segment.component.collection.uid == self.uid
-        ):
+        segment = agent.current_segment
+        if segment is not None and segment.collection is self:
             return
 
         # Otherwise, agent is entering BEZ from the outside
-        if not self.occupied and self.wait_queue[0] == agent:
+        if not self.occupied and self._wait_queue[0] == agent:
             self.pop_from_wait_queue()
             self.occupied = True
         else:
@@ -108,15 +108,12 @@ class BlockExclusiveZone(BaseCollection):
 
     def release_agent(self, agent: Agent) -> None:
         # If agent is staying in the same BEZ, do nothing
-        if (
-            agent.current_segment.next is not None
-            and agent.current_segment.next.component.collection is not None
-            and agent.current_segment.next.component.collection.uid == self.uid
-        ):
+        next_segment = agent.current_segment.next
+        if next_segment is not None and next_segment.collection is self:
             return
 
         # Otherwise, agent is leaving BEZ
         self.occupied = False
-        if len(self.wait_queue) > 0:
+        if len(self._wait_queue) > 0:
             # Re-try entry for agent at the head of the BEZ wait queue
-            self.wait_queue[0].current_segment.next.component.resource.process_queue()
+            self._wait_queue[0].current_segment.next.component.resource.process_queue()
@@ -1,13 +1,12 @@
 """Contains classes describing specific track components and behaviour."""
 
+import heapq
 import logging
 import math
 from typing import Optional
 
-from scipy.stats import burr
-
 from spur.core.base import ResourceComponent, SpurResource, Agent
-from spur.core.jitter import NoJitter
+from spur.core.jitter import BatchedSamples, NoJitter
 
 from spur.core.exception import NotPositiveError
 
@@ -31,6 +30,7 @@ class TimedTrack(ResourceComponent):
     """
 
     __name__ = "TimedTrack"
+    __slots__ = ("_traversal_time",)
 
     def __init__(
         self, model, uid, traversal_time, capacity=1, jitter=NoJitter(), collection=None
@@ -55,9 +55,13 @@ class TimedTrack(ResourceComponent):
 
     def do(self, train):
         # Simply yield the train as ready to go
-        time = self.traversal_time + self._jitter.jitter()
-        self.simLog.debug(f"Responding with traversal of {time}")
-        yield self.model.timeout(time)
+        if self._no_jitter:
+            time = self._traversal_time
+        else:
+            time = self._traversal_time + self._jitter.jitter()
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Responding with traversal of %s", time)
+        yield self._timeout(time)
 
 
 class PhysicsTrack(ResourceComponent):
@@ -89,6 +93,7 @@ class PhysicsTrack(ResourceComponent):
     """
 
     __name__ = "PhysicsTrack"
+    __slots__ = ("_length", "_track_speed")
 
     def __init__(self, model, uid, length, track_speed, jitter=NoJitter(), collection=None) -> None:
         resource = SpurResource(model, self, capacity=1)
@@ -124,8 +129,9 @@ class PhysicsTrack(ResourceComponent):
         # Start by accelerating the train
         time = math.ceil(train.basic_traversal(self.length, self.track_speed))
 
-        self.simLog.debug(f"Traversing me will take {time} steps.")
-        yield self.model.timeout(time)
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Traversing me will take %s steps.", time)
+        yield self._timeout(time)
 
 
 class MultiBlockTrack(ResourceComponent):
@@ -143,142 +149,189 @@ class MultiBlockTrack(ResourceComponent):
     """
 
     __name__ = "MultiBlockTrack"
+    __slots__ = ("_num_tracks", "_num_blocks", "_traversal_time", "_block_traversal_time", "_blocks", "_occupied",
+                 "_block_waiting", "_entry_block", "_dir_ranges", "_track_occupancy", "_track_directions",
+                 "_track_assignments", "_direction_cache", "_admission", "_u", "_v", "_node_sets")
 
     def __init__(self, model, uid, num_tracks: int, num_blocks: int, traversal_time, jitter=NoJitter(),
                  collection=None) -> None:
         self._num_tracks = num_tracks
         self._num_blocks = num_blocks
+        self._traversal_time = traversal_time
         self._block_traversal_time = int(math.ceil(traversal_time / num_blocks))  # Round up to integer
 
-        # Track all blocks and all tracks in 2D list
-        self._blocks: list[list[Optional[Agent]]] = []
-        for i in range(num_tracks):
-            track = []
-            for j in range(num_blocks):
-                track.append(None)
-            self._blocks.append(track)
+        # Track all blocks of all tracks in one flat list, block b of track t being at t * num_blocks + b,
+        # with a parallel occupancy map (1 where a block holds a train) that can be scanned at C speed
+        self._blocks: list[Optional[Agent]] = [None] * (num_tracks * num_blocks)
+        self._occupied = bytearray(num_tracks * num_blocks)
+        # SimPy event of the train in each block if it is waiting for the block ahead to clear, else None
+        self._block_waiting: list = [None] * (num_tracks * num_blocks)
+        # Block a train enters a track at, by travel direction
+        self._entry_block = {1: 0, -1: num_blocks - 1}
+        # Blocks of a track in the order a train passes them, by travel direction
+        self._dir_ranges = {1: range(num_blocks), -1: range(num_blocks - 1, -1, -1)}
+        # Number of trains on each track; moving between blocks does not change it
+        self._track_occupancy = [0] * num_tracks
 
         # Record the travel direction of each track as 1 or -1, or None if track empty
         self._track_directions: list[Optional[int]] = [None] * num_tracks
         self._track_assignments = dict()
-        self._train_waiting_events = dict()  # Store SimPy events used to handle wait-queueing of trains between blocks
+        # Travel directions worked out while trains wait to enter, with the segment they were computed from
+        self._direction_cache = dict()
+        # (train, direction, track) chosen by the last successful can_accept_agent, for accept_agent to reuse
+        self._admission = None
+        # This component's graph nodes, looked up on first use once the model graph is built
+        self._u = None
+        self._v = None
+        # Graph nodes of neighbouring components as frozensets, keyed by component
+        self._node_sets = dict()
         resource = SpurResource(model, self, capacity=num_tracks*num_blocks)
         super().__init__(model, uid, resource, jitter, collection)
         # Override the simulation logging information
         self.simLog = logging.getLogger(f"sim.track.{self.__name__}.{self.uid}")
 
     def _get_travel_direction(self, train) -> int:
-        c_dict = self._model.component_dictionary()
-        u = c_dict[self._uid]["u"]
-        v = c_dict[self._uid]["v"]
+        # A waiting train is re-checked every time the queue is processed; its direction only
+        # changes if its current segment does
+        segment = train.current_segment
+        cached = self._direction_cache.get(train)
+        if cached is not None and cached[0] is segment:
+            return cached[1]
+        direction = self._compute_travel_direction(train)
+        self._direction_cache[train] = (segment, direction)
+        return direction
+
+    def _ensure_endpoints(self) -> None:
+        if self._u is None:
+            d = self._model.component_dictionary()[self.uid]
+            self._u, self._v = d["u"], d["v"]
+
+    def _nodes_of(self, component) -> frozenset:
+        nodes = self._node_sets.get(component)
+        if nodes is None:
+            d = self._model.component_dictionary()[component.uid]
+            nodes = self._node_sets[component] = frozenset((d["u"], d["v"]))
+        return nodes
+
+    def _compute_travel_direction(self, train) -> int:
+        self._ensure_endpoints()
+        u, v = self._u, self._v
 
         # When this method is called, the current_segment of the train still points to the segment before this one,
         # so it is already the "prev" we want
         try:
-            prev_c = train.current_segment.component
-            prev_u = c_dict[prev_c.uid]["u"]
-            prev_v = c_dict[prev_c.uid]["v"]
+            prev_nodes = self._nodes_of(train.current_segment.component)
         except AttributeError:
-            prev_c, prev_u, prev_v = None, None, None
+            prev_nodes = None
 
         # The "next" we want is the segment after this one, so it is current_segment's next-next
         try:
-            next_c = train.current_segment.next.next.component
-            next_u = c_dict[next_c.uid]["u"]
-            next_v = c_dict[next_c.uid]["v"]
+            next_nodes = self._nodes_of(train.current_segment.next.next.component)
         except AttributeError:
-            next_c, next_u, next_v = None, None, None
+            next_nodes = None
 
-        if prev_c is not None and next_c is not None:
+        if prev_nodes is not None and next_nodes is not None:
             # If node u is shared between current component and previous,
             # and node v is shared between current component and next
-            if u in [prev_u, prev_v] and v in [next_u, next_v]:
+            if u in prev_nodes and v in next_nodes:
                 # Direction is from u to v
                 return 1
             # If node v is shared between current component and previous,
             # and node u is shared between current component and next
-            elif v in [prev_u, prev_v] and u in [next_u, next_v]:
+            elif v in prev_nodes and u in next_nodes:
                 # Direction is from v to u
                 return -1
 
         # If this is the first segment of the train, only look at the next segment
-        if prev_c is None:
-            if v in [next_u, next_v]:
+        if prev_nodes is None and next_nodes is not None:
+            if v in next_nodes:
                 return 1
-            elif u in [next_u, next_v]:
+            elif u in next_nodes:
                 return -1
 
         # If this is the last segment of the train, only look at the previous segment
-        if next_c is None:
-            if u in [prev_u, prev_v]:
+        if next_nodes is None and prev_nodes is not None:
+            if u in prev_nodes:
                 return 1
-            elif v in [prev_u, prev_v]:
+            elif v in prev_nodes:
                 return -1
 
         raise Exception("Error getting travel direction")
 
-    def _iterate_track_blocks(self, track: int, direction: int):
-        if direction == 1:
-            start = 0
-            end = self._num_blocks
-        elif direction == -1:
-            start = self._num_blocks - 1
-            end = -1
-        else:
-            raise Exception("Direction has to be 1 or -1")
-
-        for block in range(start, end, direction):
-            yield self._blocks[track][block]
-
     def _count_empty_from_front(self, track: int, direction: int) -> int:
-        count = 0
-
-        for b in self._iterate_track_blocks(track, direction):
-            if b is not None:
-                break
-            count += 1
-
-        return count
+        offset = track * self._num_blocks
+        end = offset + self._num_blocks
 
-    def _assign_track(self, train, direction: int) -> int:
-        same_dir_tracks: list[dict] = []
-        empty_tracks: list[int] = []
+        # Find the first occupied block from the entry end of the track
+        if direction == 1:
+            first = self._occupied.find(1, offset, end)
+            return self._num_blocks if first == -1 else first - offset
+        else:
+            first = self._occupied.rfind(1, offset, end)
+            return self._num_blocks if first == -1 else end - 1 - first
+
+    def _assign_track(self, direction: int) -> int:
+        # Return the track a train travelling in direction should enter, or -1 if none can take it
+        if self._num_tracks == 1:
+            # A single track takes the train if it is empty, or runs the same way with a free entry block
+            dir_0 = self._track_directions[0]
+            if dir_0 is None or (dir_0 == direction and not self._occupied[self._entry_block[direction]]):
+                return 0
+            return -1
+
+        best_track = -1
+        best_count = self._num_blocks + 1
+        first_empty = -1
 
         for t, dir_t in enumerate(self._track_directions):
             if dir_t == direction:
-                same_dir_tracks.append({"track": t, "empty_count": self._count_empty_from_front(t, direction)})
-            elif dir_t is None:
-                empty_tracks.append(t)
+                # Find the track with the smallest gap behind previous train
+                # Empty count must be greater than 0; otherwise new train cannot enter
+                empty_count = self._count_empty_from_front(t, direction)
+                if 0 < empty_count < best_count:
+                    best_track, best_count = t, empty_count
+            elif dir_t is None and first_empty < 0:
+                first_empty = t
 
         # Prefer tracks already containing a train travelling in the same direction
-        if len(same_dir_tracks) > 0:
-            # Find the track with the smallest gap behind previous train
-            same_dir_tracks = sorted(same_dir_tracks, key=lambda x: x["empty_count"])
-            for track in same_dir_tracks:
-                # Empty count must be greater than 0; otherwise new train cannot enter
-                # Pick the first track with the smallest non-zero empty count
-                if track["empty_count"] > 0:
-                    return track["track"]
+        if best_track >= 0:
+            return best_track
 
-        if len(empty_tracks) == 0:
-            raise Exception(f"Train {train.uid} cannot enter the component despite being allowed to")
+        return first_empty
 
-        return empty_tracks[0]
+    def _advance_behind(self, i: int, b: int, direction: int, start: int) -> None:
+        # Take care of the train behind block b, just vacated at flat index i
+        if b == start:
+            # If leaving starting block, check if trains waiting outside the component could now enter
+            self._res.process_queue()
+        else:
+            # If there is a train waiting in previous block, allow it to enter current block
+            waiting = self._block_waiting[i - direction]
+            if waiting is not None:
+                self._block_waiting[i - direction] = None
+                waiting.succeed()
 
     def accept_agent(self, agent: Agent):
-        direction = self._get_travel_direction(agent)
+        admission = self._admission
+        if admission is not None and admission[0] is agent:
+            # Reuse the track picked when the train was checked for admission
+            _, direction, assigned_track = admission
+            self._admission = None
+        else:
+            direction = self._get_travel_direction(agent)
+            assigned_track = self._assign_track(direction)
+            if assigned_track < 0:
+                raise Exception(f"Train {agent.uid} cannot enter the component despite being allowed to")
+        # The train is inside now; its direction will not be asked for again
+        del self._direction_cache[agent]
 
-        assigned_track = self._assign_track(agent, direction)
         self._track_assignments[agent.uid] = assigned_track
 
-        if direction == 1:
-            start = 0
-        else:
-            start = self._num_blocks - 1
-
-        self._blocks[assigned_track][start] = agent
+        i = assigned_track * self._num_blocks + self._entry_block[direction]
+        self._blocks[i] = agent
+        self._occupied[i] = 1
+        self._track_occupancy[assigned_track] += 1
         self._track_directions[assigned_track] = direction
-        self._train_waiting_events[agent.uid] = self._model.event()
 
         # print(f"Accepting {agent.uid} on track {assigned_track} with direction {direction}")
 
@@ -289,34 +342,25 @@ class MultiBlockTrack(ResourceComponent):
         direction = self._track_directions[t]
 
         # Upon release, train should be located at the final block, depending on the direction
-        if direction == 1:
-            b = self._num_blocks - 1
-            start = 0
-        else:
-            b = 0
-            start = self._num_blocks - 1
+        blocks = self._dir_ranges[direction]
+        start = blocks[0]
+        b = blocks[-1]
 
-        if self._blocks[t][b] is None or self._blocks[t][b].uid != agent.uid:
+        i = t * self._num_blocks + b
+        if self._blocks[i] is None or self._blocks[i].uid != agent.uid:
             raise Exception("Cannot release the train since it has not yet traversed to the final block")
 
         # Remove train
-        self._blocks[t][b] = None
+        self._blocks[i] = None
+        self._occupied[i] = 0
         del self._track_assignments[agent.uid]
-        del self._train_waiting_events[agent.uid]
+        self._track_occupancy[t] -= 1
 
         # If track is now all empty, reset direction info
-        if self._blocks[t].count(None) == len(self._blocks[t]):
+        if self._track_occupancy[t] == 0:
             self._track_directions[t] = None
 
-        # Take care of the train behind
-        if b == start:
-            # If leaving starting block, check if trains waiting outside the component could now enter
-            self._res.process_queue()
-        elif self._blocks[t][b - direction] is not None:
-            # If there is a train in previous block, allow it to enter current block
-            prev_agent = self._blocks[t][b - direction]
-            self._train_waiting_events[prev_agent.uid].succeed()
-            self._train_waiting_events[prev_agent.uid] = self._model.event()
+        self._advance_behind(i, b, direction, start)
 
         return super().release_agent(agent)
 
@@ -328,54 +372,54 @@ class MultiBlockTrack(ResourceComponent):
         direction = self._get_travel_direction(agent)
         # print(f"Checking eligibility for {agent.uid}: {self._blocks}, {self._track_directions}")
 
-        # Check the current travel direction of each track
-        for t, dir_t in enumerate(self._track_directions):
-            if dir_t == direction and next(self._iterate_track_blocks(t, direction)) is None:
-                # If track direction matches train's and if the entry block is unoccupied, accept the train
-                return True
-            elif dir_t is None:
-                # Or if there is at least one empty track, accept the train
-                return True
+        # Accept the train if a track running its way has a free entry block, or if a track is empty
+        assigned_track = self._assign_track(direction)
+        if assigned_track < 0:
+            return False
 
-        # Otherwise, do not accept the train
-        return False
+        # The resource admits an accepted train straight away, so keep the choice for accept_agent
+        self._admission = (agent, direction, assigned_track)
+        return True
 
     def do(self, train):
         assigned_track = self._track_assignments[train.uid]
         direction = self._track_directions[assigned_track]
 
-        if direction == 1:
-            start = 0
-            end = self._num_blocks
-            last = end - 1
-        else:
-            start = self._num_blocks - 1
-            end = -1
-            last = 0
+        blocks = self._dir_ranges[direction]
+        start = blocks[0]
+        last = blocks[-1]
+
+        # Bind what every block of the loop needs to locals
+        offset = assigned_track * self._num_blocks
+        trains = self._blocks
+        occupied = self._occupied
+        timeout = self._timeout
+        no_jitter = self._no_jitter
+        block_time = self._block_traversal_time
+        num_blocks = self._num_blocks
 
         # Traverse through each block along the assigned track
-        for b in range(start, end, direction):
+        for b in blocks:
             # Wait to traverse the individual block (with the overall jitter divided by the number of blocks)
-            yield self._model.timeout(round(self._block_traversal_time + self._jitter.jitter() / self._num_blocks))
+            if no_jitter:
+                yield timeout(block_time)
+            else:
+                yield timeout(round(block_time + self._jitter.jitter() / num_blocks))
 
             if b != last:
                 # If next block is occupied, sleep until woken up
-                if self._blocks[assigned_track][b + direction] is not None:
-                    yield self._train_waiting_events[train.uid]
+                i = offset + b
+                if trains[i + direction] is not None:
+                    waiting = self._block_waiting[i] = self._model.event()
+                    yield waiting
 
                 # Next block is unoccupied, shift train over
-                self._blocks[assigned_track][b + direction] = train
-                self._blocks[assigned_track][b] = None
+                trains[i + direction] = train
+                occupied[i + direction] = 1
+                trains[i] = None
+                occupied[i] = 0
 
-                # Take care of the train behind
-                if b == start:
-                    # If leaving starting block, check if trains waiting outside the component could now enter
-                    self._res.process_queue()
-                elif self._blocks[assigned_track][b - direction] is not None:
-                    # If there is a train in previous block, allow it to enter current block
-                    prev_train = self._blocks[assigned_track][b - direction]
-                    self._train_waiting_events[prev_train.uid].succeed()
-                    self._train_waiting_events[prev_train.uid] = self._model.event()
+                self._advance_behind(i, b, direction, start)
 
 
 class SimpleYard(ResourceComponent):
@@ -399,6 +443,7 @@ class SimpleYard(ResourceComponent):
     """
 
     __name__ = "SimpleYard"
+    __slots__ = ()
 
     def __init__(self, model, uid, capacity, jitter=NoJitter(), collection=None) -> None:
         resource = SpurResource(model, self, capacity=capacity)
@@ -408,8 +453,9 @@ class SimpleYard(ResourceComponent):
 
     def do(self, train):
         # Simply yield the train as ready to go
-        yield self.model.timeout(0)
-        self.simLog.debug(f"Train {train.uid} ready to go!")
+        yield self._timeout(0)
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Train %s ready to go!", train.uid)
 
 
 class SimpleStation(ResourceComponent):
@@ -442,6 +488,7 @@ class SimpleStation(ResourceComponent):
     """
 
     __name__ = "SimpleStation"
+    __slots__ = ("_mean_boarding", "_mean_alighting", "_base_dwell", "_dwell_const")
 
     def __init__(
         self, model, uid, mean_boarding, mean_alighting, jitter=NoJitter(), collection=None
@@ -450,18 +497,18 @@ class SimpleStation(ResourceComponent):
         super().__init__(model, uid, resource, jitter, collection)
         self._mean_boarding = mean_boarding
         self._mean_alighting = mean_alighting
+        # Dwell time model from San2016, less the jitter
+        self._base_dwell = 2 + 0.4 * mean_boarding + 0.4 * mean_alighting
+        self._dwell_const = round(self._base_dwell)
         # Override the simulation logging information
         self.simLog = logging.getLogger(f"sim.track.{self.__name__}.{self.uid}")
 
     def do(self, train):
-        # Dwell time model from San2016
-        dwell = round(
-            2
-            + 0.4 * self._mean_boarding
-            + 0.4 * self._mean_alighting
-            + self._jitter.jitter()
-        )
-        yield self.model.timeout(dwell)
+        if self._no_jitter:
+            # Without jitter the dwell never changes
+            yield self._timeout(self._dwell_const)
+            return
+        yield self._timeout(round(self._base_dwell + self._jitter.jitter()))
 
 
 class MultiTrackStation(ResourceComponent):
@@ -470,16 +517,30 @@ class MultiTrackStation(ResourceComponent):
     """
 
     __name__ = "MultiTrackStation"
+    __slots__ = ("_num_stopping_tracks", "_num_bypass_tracks", "_bypass_time", "_dwell_c", "_dwell_d", "_dwell_loc",
+                 "_dwell_scale", "_dwells", "_stopping_tracks", "_bypass_tracks", "_free_stopping", "_free_bypass",
+                 "_track_assignments")
 
     def __init__(self, model, uid, num_stopping_tracks: int, num_bypass_tracks: int, bypass_time: int,
                  dwell_c, dwell_d, dwell_loc, dwell_scale,
                  jitter=NoJitter(), collection=None) -> None:
+        self._num_stopping_tracks = num_stopping_tracks
+        self._num_bypass_tracks = num_bypass_tracks
         self._bypass_time = bypass_time
-        self._dwell_params = (dwell_c, dwell_d, dwell_loc, dwell_scale)
+        # Burr distribution parameters of the dwell time
+        self._dwell_c = dwell_c
+        self._dwell_d = dwell_d
+        self._dwell_loc = dwell_loc
+        self._dwell_scale = dwell_scale
+        self._dwells = BatchedSamples(self._sample_dwells)  # Dwell times, drawn ahead of time in batches
 
         self._stopping_tracks: list[Optional[Agent]] = [None] * num_stopping_tracks
         self._bypass_tracks: list[Optional[Agent]] = [None] * num_bypass_tracks
-        self._track_assignments: dict[str, str] = dict()
+        # Heaps of the free track indices, so the lowest free track is always taken first
+        self._free_stopping: list[int] = list(range(num_stopping_tracks))
+        self._free_bypass: list[int] = list(range(num_bypass_tracks))
+        # Track held by each train, as (is_bypass, index)
+        self._track_assignments: dict[str, tuple[bool, int]] = dict()
 
         resource = SpurResource(model, self, capacity=num_stopping_tracks+num_bypass_tracks)
         super().__init__(model, uid, resource, jitter, collection)
@@ -513,21 +574,17 @@ class MultiTrackStation(ResourceComponent):
 
     def accept_agent(self, agent: Agent):
         # If train is bypassing, first check if there is an available bypass track
-        if not self._train_is_stopping(agent, current=False):
-            for t in range(len(self._bypass_tracks)):
-                if self._bypass_tracks[t] is None:
-                    self._bypass_tracks[t] = agent
-                    self._track_assignments[agent.uid] = f"B-{t}"
-                    break
+        if not self._train_is_stopping(agent, current=False) and self._free_bypass:
+            t = heapq.heappop(self._free_bypass)
+            self._bypass_tracks[t] = agent
+            self._track_assignments[agent.uid] = (True, t)
 
         # If train does not have an assigned track by this point, either it is stopping,
         # or it is bypassing and there is no available bypass track -> try to assign to a stopping track
-        if agent.uid not in self._track_assignments:
-            for t in range(len(self._stopping_tracks)):
-                if self._stopping_tracks[t] is None:
-                    self._stopping_tracks[t] = agent
-                    self._track_assignments[agent.uid] = f"S-{t}"
-                    break
+        if agent.uid not in self._track_assignments and self._free_stopping:
+            t = heapq.heappop(self._free_stopping)
+            self._stopping_tracks[t] = agent
+            self._track_assignments[agent.uid] = (False, t)
 
         # Train must have a track assigned by this point
         if agent.uid not in self._track_assignments:
@@ -536,15 +593,14 @@ class MultiTrackStation(ResourceComponent):
         super().accept_agent(agent)
 
     def release_agent(self, agent: Agent):
-        track_type, track_index = self._track_assignments[agent.uid].split("-")
-        track_index = int(track_index)
+        is_bypass, track_index = self._track_assignments.pop(agent.uid)
 
-        if track_type == "S":
-            self._stopping_tracks[track_index] = None
-        else:
+        if is_bypass:
             self._bypass_tracks[track_index] = None
-
-        del self._track_assignments[agent.uid]
+            heapq.heappush(self._free_bypass, track_index)
+        else:
+            self._stopping_tracks[track_index] = None
+            heapq.heappush(self._free_stopping, track_index)
 
         return super().release_agent(agent)
 
@@ -555,21 +611,31 @@ class MultiTrackStation(ResourceComponent):
 
         if self._train_is_stopping(agent, current=False):
             # If train is stopping and there is at least one free stopping track, accept the train
-            if self._stopping_tracks.count(None) > 0:
+            if self._free_stopping:
                 return True
         else:
             # If train is bypassing and there is at least one free track of either type, accept the train
-            if self._bypass_tracks.count(None) + self._stopping_tracks.count(None) > 0:
+            if self._free_bypass or self._free_stopping:
                 return True
 
         return False
 
+    def _sample_dwells(self, size):
+        """Draw `size` Burr distributed dwell times."""
+        from scipy.stats import burr
+
+        return burr.rvs(self._dwell_c, self._dwell_d, self._dwell_loc, self._dwell_scale, size=size)
+
     def do(self, train):
         if self._train_is_stopping(train, current=True):
-            dwell = round(burr.rvs(*self._dwell_params) + self._jitter.jitter())
-            yield self.model.timeout(dwell)
+            dwell = next(self._dwells)
+            if not self._no_jitter:
+                dwell += self._jitter.jitter()
+            yield self._timeout(round(dwell))
+        elif self._no_jitter:
+            yield self._timeout(self._bypass_time)
         else:
-            yield self.model.timeout(self._bypass_time + self._jitter.jitter())
+            yield self._timeout(self._bypass_time + self._jitter.jitter())
 
 
 class TimedStation(ResourceComponent):
@@ -595,6 +661,7 @@ class TimedStation(ResourceComponent):
     """
 
     __name__ = "TimedStation"
+    __slots__ = ("_mean_boarding", "_mean_alighting", "_base_dwell", "_dwell_const", "_traversal_time")
 
     def __init__(
         self,
@@ -610,19 +677,19 @@ class TimedStation(ResourceComponent):
         super().__init__(model, uid, resource, jitter, collection)
         self._mean_boarding = mean_boarding
         self._mean_alighting = mean_alighting
+        # Dwell time model from San2016, less the jitter
+        self._base_dwell = 2 + 0.4 * mean_boarding + 0.4 * mean_alighting
+        self._dwell_const = round(self._base_dwell)
         self._traversal_time = traversal_time
         # Override the simulation logging information
         self.simLog = logging.getLogger(f"sim.track.{self.__name__}.{self.uid}")
 
     def do(self, train):
-        # Dwell time model from San2016
-        dwell = round(
-            2
-            + 0.4 * self._mean_boarding
-            + 0.4 * self._mean_alighting
-            + self._jitter.jitter()
-        )
-        yield self.model.timeout(dwell)
+        if self._no_jitter:
+            # Without jitter the dwell never changes
+            yield self._timeout(self._dwell_const)
+            return
+        yield self._timeout(round(self._base_dwell + self._jitter.jitter()))
 
 
 class SimpleCrossover(ResourceComponent):
@@ -651,6 +718,7 @@ class SimpleCrossover(ResourceComponent):
     """
 
     __name__ = "SimpleCrossover"
+    __slots__ = ("_traversal_time",)
 
     def __init__(self, model, uid, traversal_time, jitter=NoJitter(), collection=None) -> None:
         self.traversal_time = traversal_time
@@ -669,5 +737,7 @@ class SimpleCrossover(ResourceComponent):
         self._traversal_time = traversal_time
 
     def do(self, train):
-        time = self.traversal_time + self._jitter.jitter()
-        yield self.model.timeout(time)
+        if self._no_jitter:
+            yield self._timeout(self._traversal_time)
+        else:
+            yield self._timeout(self._traversal_time + self._jitter.jitter())
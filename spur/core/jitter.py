@@ -5,7 +5,6 @@ import logging
 
 from abc import ABC, abstractmethod
 
-from scipy.stats import norm, lognorm
 import numpy as np
 
 from spur.core.exception import NotAProbabilityError
@@ -42,6 +41,60 @@ class BaseJitter(ABC):
         pass
 
 
+# Number of random samples drawn per call into numpy/scipy
+BATCH_SIZE = 1024
+
+
+class BatchedSamples:
+    """Iterator over random samples drawn from numpy/scipy in batches
+
+    Calling a scipy distribution once per sample is dominated by call overhead,
+    so `draw(size)` is called for `BATCH_SIZE` samples at a time and they are
+    handed out one by one. Callers should import scipy.stats inside `draw`
+    rather than at module level, as it dominates the package import time.
+
+    Parameters
+    ----------
+    draw : callable
+        Takes a sample count and returns a numpy array of that many samples.
+    """
+
+    __slots__ = ("_draw", "_samples")
+
+    def __init__(self, draw) -> None:
+        self._draw = draw
+        self._samples = iter(())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._samples)
+        except StopIteration:
+            self._samples = iter(self._draw(BATCH_SIZE).tolist())
+            return next(self._samples)
+
+
+class _BatchedJitter(BaseJitter):
+    """Base for jitters whose samples are drawn in batches, see `BatchedSamples`
+
+    Child classes implement `_sample(size)`, returning an array of rounded
+    perturbations.
+    """
+
+    def __init__(self) -> None:
+        self._samples = BatchedSamples(lambda size: self._sample(size).astype(int))
+        super().__init__()
+
+    @abstractmethod
+    def _sample(self, size):
+        pass
+
+    def jitter(self) -> int:
+        return next(self._samples)
+
+
 class NoJitter(BaseJitter):
     """Jitter component that produces no jitter
 
@@ -91,7 +144,7 @@ class UniformJitter(BaseJitter):
         return random.randint(self._min, self._max)
 
 
-class GaussianJitter(BaseJitter):
+class GaussianJitter(_BatchedJitter):
     """Jitter component producing Gaussian (normally) distributed perturbations
 
     Methods
@@ -116,11 +169,13 @@ class GaussianJitter(BaseJitter):
         self._std = std
         super().__init__()
 
-    def jitter(self) -> int:
-        return round(norm.rvs(loc=self._mean, scale=self._std))
+    def _sample(self, size):
+        from scipy.stats import norm
 
+        return np.rint(norm.rvs(loc=self._mean, scale=self._std, size=size))
 
-class LognormalJitter(BaseJitter):
+
+class LognormalJitter(_BatchedJitter):
     """Jitter component producing lognormally distributed perturbations
 
     This perturbation assumes a supplied mean and standard deviation
@@ -158,8 +213,10 @@ class LognormalJitter(BaseJitter):
         self._mean = mean
         super().__init__()
 
-    def jitter(self):
-        return round(lognorm.rvs(s=self._s, scale=self._scale) - self._mean)
+    def _sample(self, size):
+        from scipy.stats import lognorm
+
+        return np.rint(lognorm.rvs(s=self._s, scale=self._scale, size=size) - self._mean)
 
 
 class DisruptionJitter(BaseJitter):
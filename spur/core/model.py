@@ -3,10 +3,12 @@
 import logging
 import json
 import importlib
+import os
 
 from simpy import Environment
 from networkx import MultiGraph
 
+from spur.core.base import SimFormatter
 from spur.core.train import Train
 from spur.core.jitter import NoJitter
 from spur.core.route import Route
@@ -18,16 +20,6 @@ from spur.core.exception import NotUniqueIDError, InputMismatchError
 logger = logging.getLogger(__name__)
 
 
-class SimLogFilter(logging.Filter):
-    def __init__(self, model, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.model = model
-
-    def filter(self, record) -> bool:
-        record.now = self.model.now
-        return True
-
-
 class Model(Environment):
     """The model class
 
@@ -37,14 +29,19 @@ class Model(Environment):
         The graph representation of the model system
     simLog : `logging.Logger`
         The logging component of the model
+    agent_log : bool
+        Whether agent movements are written to log/agent.log
     """
 
-    def __init__(self, debug=False, *args, **kwargs):
+    def __init__(self, debug=False, *args, agent_log=True, **kwargs):
         super().__init__(*args, **kwargs)
+        self._agent_log = agent_log
         self.G = MultiGraph()
         self._trains = {}
         self._tours = {}  # Used as a container to keep track of possible tours
         self._collections = {}  # Used as a container to keep track of all collections
+        self._uids = set()  # UIDs of every item created in this model
+        self._component_dict = None  # Built on first use, reset whenever a component is added
 
         # Set up logging environment for the simulation output
         self.simLog = logging.getLogger("sim")
@@ -53,9 +50,8 @@ class Model(Environment):
         # Set up stout output and formatting
         sh = logging.StreamHandler()
         sh.setLevel(logging.INFO)
-        sh.addFilter(SimLogFilter(self))
-        simFormatter = logging.Formatter(
-            "%(now)-6d %(name)-35s  %(message)s", style="%"
+        simFormatter = SimFormatter(
+            self, "%(now)-6d %(name)-35s  %(message)s", style="%"
         )
         sh.setFormatter(simFormatter)
         self.simLog.addHandler(sh)
@@ -63,9 +59,8 @@ class Model(Environment):
         # Set up logfile output and formatting
         fh = logging.FileHandler("log/sim.log", mode="w")
         fh.setLevel(logging.INFO)
-        fh.addFilter(SimLogFilter(self))
-        simFileFormatter = logging.Formatter(
-            "%(now)-6d %(levelname)-8s %(name)-30s  %(message)s", style="%"
+        simFileFormatter = SimFormatter(
+            self, "%(now)-6d %(levelname)-8s %(name)-30s  %(message)s", style="%"
         )
         fh.setFormatter(simFileFormatter)
         self.simLog.addHandler(fh)
@@ -74,15 +69,37 @@ class Model(Environment):
         if debug == True:
             dfh = logging.FileHandler("log/debug.log", mode="w")
             dfh.setLevel(logging.DEBUG)
-            dfh.addFilter(SimLogFilter(self))
-            simFileFormatter = logging.Formatter(
-                "%(now)-6d %(levelname)-8s %(name)-30s  %(message)s", style="%"
+            simFileFormatter = SimFormatter(
+                self, "%(now)-6d %(levelname)-8s %(name)-30s  %(message)s", style="%"
             )
             dfh.setFormatter(simFileFormatter)
             self.simLog.addHandler(dfh)
 
+        # Set up logfile output and formatting for agents, shared by every agent
+        agentLog = logging.getLogger("agent")
+        agentLog.setLevel(logging.INFO)
+        agentLog.propagate = False
+        # Remove the handler left behind by any previously created model, so each record
+        # is written once and stamped with this model's time
+        agent_log_path = os.path.abspath("log/agent.log")
+        for h in agentLog.handlers[:]:
+            if isinstance(h, logging.FileHandler) and h.baseFilename == agent_log_path:
+                agentLog.removeHandler(h)
+                h.close()
+        if agent_log:
+            # Only open the file once an agent actually logs something
+            afh = logging.FileHandler(agent_log_path, mode="w", delay=True)
+            afh.setLevel(logging.INFO)
+            agentFileFormatter = SimFormatter(self, "%(now)d,%(shortname)s,%(message)s", style="%")
+            afh.setFormatter(agentFileFormatter)
+            agentLog.addHandler(afh)
+
         self.simLog.info("Model setup complete!")
 
+    @property
+    def agent_log(self):
+        return self._agent_log
+
     @property
     def trains(self):
         return self._trains
@@ -96,16 +113,21 @@ class Model(Environment):
         return self._collections
 
     def _uid_unique(self, uid):
-        if uid in self._trains.keys() or uid in self._tours.keys():
-            return False
-        else:
-            return True
+        return uid not in self._uids and uid not in self._tours
+
+    def _register_uid(self, uid):
+        """Reserve `uid` for a new item, raising NotUniqueIDError if it is taken."""
+        if not self._uid_unique(uid):
+            raise NotUniqueIDError(f"UID {uid} has been used already.")
+        self._uids.add(uid)
 
     def component_dictionary(self):
-        d_out = dict()
-        for u, v, d in self.G.edges(data=True):
-            d_out[d["c"].uid] = {"c": d["c"], "u": u, "v": v}
-        return d_out
+        if self._component_dict is None:
+            d_out = dict()
+            for u, v, d in self.G.edges(data=True):
+                d_out[d["c"].uid] = {"c": d["c"], "u": u, "v": v}
+            self._component_dict = d_out
+        return self._component_dict
 
     def add_component(self, component_type, u, v, key, *args, **kwargs):
         """Add a component to the model network
@@ -126,7 +148,9 @@ class Model(Environment):
         c = component_type(self, f"{u}-{v}-{key}", *args, **kwargs)
         # Add it to the graph
         self.G.add_edge(u, v, key=key, c=c)
-        self.simLog.debug(f"Added {c.__name__} {c.uid}")
+        self._component_dict = None
+        if self.simLog.isEnabledFor(logging.DEBUG):
+            self.simLog.debug("Added %s %s", c.__name__, c.uid)
         return c
 
     def add_train(self, uid, max_speed, tour) -> Train:
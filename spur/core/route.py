@@ -177,6 +177,8 @@ class RouteSegment:
         The route the component is a part of
     component : `spur.core.BaseComponent` child
         The component this route segment represents
+    collection : `spur.core.BaseCollection` child
+        The collection the component belongs to. Could be None.
     prev :  `RouteSegment`
         The previous route segment
     next : `RouteSegment`
@@ -218,6 +220,12 @@ class RouteSegment:
     @component.setter
     def component(self, component):
         self._component = component
+        # A component's collection is fixed at construction, so look it up once here
+        self._collection = component.collection
+
+    @property
+    def collection(self):
+        return self._collection
 
     @property
     def arrival(self):
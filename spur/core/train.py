@@ -1,3 +1,4 @@
+import functools
 import logging
 import math
 
@@ -10,6 +11,44 @@ from spur.core.component import PhysicsTrack
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _traversal_kinematics(distance, speed, max_speed, final_speed, acceleration, deceleration):
+    """Time to cover `distance` starting at `speed` and ending at `final_speed`.
+
+    Plain arithmetic on floats, kept free of any train or logging state. Trains enter
+    and leave tracks at a handful of speeds (track speeds or standstill), so results
+    are memoised.
+
+    Returns
+    -------
+    tuple
+        The traversal time, and the peak speed reached if the train cannot reach
+        `max_speed` within `distance` (None otherwise).
+    """
+    # Let's look at some cases:
+    # If we start below the max, we'll want to accel, cruise, then decel if possible
+    accel_dist = ((max_speed * max_speed) - (speed * speed)) / (2 * acceleration)
+    decel_dist = ((max_speed * max_speed) - (final_speed * final_speed)) / (2 * deceleration)
+
+    if accel_dist + decel_dist <= distance:
+        # Simple, we just take three chunks
+        accel_time = (max_speed - speed) / acceleration
+        decel_time = (max_speed - final_speed) / deceleration
+        cruise_time = (distance - accel_dist - decel_dist) / max_speed
+        return accel_time + decel_time + cruise_time, None
+
+    # Going to be an up and a down such that the sum of the two matches the distance
+    numerator = (
+        distance
+        + (speed**2 / (2 * acceleration))
+        + (final_speed**2) / (2 * deceleration)
+    )
+    denomenator = (1 / (2 * acceleration)) + (1 / (2 * deceleration))
+    v_peak = math.sqrt(numerator / denomenator)
+    time = ((v_peak - speed) / acceleration) + ((v_peak - final_speed) / deceleration)
+    return time, v_peak
+
+
 class Train(Agent):
     """A class used to represent a train agent
 
@@ -44,11 +83,10 @@ class Train(Agent):
         self._speed = 0
 
         # Override base logging information
-        self.logger = logging.getLogger(f"{logger.name}.{uid}")
+        self.logger = logger
 
         # Override the simulation logging information
         self.simLog = logging.getLogger(f"sim.{self.__name__}.{uid}")
-        self.simLog.debug("I am alive!")
         # self.simLog.debug(f"Tour: {self.tour.uids()}")
 
         # Override the agent logging information
@@ -67,39 +105,53 @@ class Train(Agent):
         before they start running again.
         """
         prev_req = None
+        # Bind the objects used on every segment once for the whole tour
+        model = self.model
+        simLog = self.simLog
+        agentLog = self.agentLog
+        log_agent = model.agent_log
+        debug = simLog.isEnabledFor(logging.DEBUG)
 
         for segment in self.tour.traverse():
+            component = segment.component
             # First let's wait for arrival if needed.
-            if segment.arrival is not None:
+            arrival = segment.arrival
+            if arrival is not None:
                 try:
-                    wait_time = max(0, segment.arrival - self.model.now)
-                    self.simLog.debug(
-                        f"Arrival | Now: {self.model.now} | Schedule: {segment.arrival} | Wait: {wait_time}"
-                    )
+                    wait_time = max(0, arrival - model.now)
+                    if debug:
+                        simLog.debug(
+                            "Arrival | Now: %s | Schedule: %s | Wait: %s", model.now, arrival, wait_time
+                        )
                     if wait_time > 0:
-                        self.simLog.info(f"Waiting for {wait_time} before arrival")
-                    yield self.model.timeout(wait_time)
+                        simLog.info(f"Waiting for {wait_time} before arrival")
+                    yield model.timeout(wait_time)
                 except Interrupt:
-                    self.simLog.warn("I was interrupted!")
-            if not self._current_segment:
-                self.simLog.debug(
+                    simLog.warn("I was interrupted!")
+            current = self._current_segment
+            if debug and not current:
+                simLog.debug(
                     "Not attached. Will try to access to first component."
                 )
             # Ask to access the upcoming segment component and accept train once successful
-            req = segment.component.resource.request(self)
+            req = component.resource.request(self)
             yield req
-            self.agentLog.info(
-                f"IN,{segment.component.uid},{segment.component.__name__}"
-            )
+            if log_agent:
+                agentLog.info(
+                    f"IN,{component.uid},{component.__name__}"
+                )
 
             # Release train from old segment component and update current segment
-            if self._current_segment:
-                self._current_segment.component.release_agent(self)
+            if current:
+                prev_component = current.component
+                prev_component.release_agent(self)
                 # Finished traversing old component
-                self.agentLog.info(
-                    f"OUT,{self._current_segment.component.uid},{self._current_segment.component.__name__}"
-                )
-                self.simLog.debug(f"Finished traversing {self._current_segment.component.uid}")
+                if log_agent:
+                    agentLog.info(
+                        f"OUT,{prev_component.uid},{prev_component.__name__}"
+                    )
+                if debug:
+                    simLog.debug("Finished traversing %s", prev_component.uid)
             self._current_segment = segment
             # Release the previous segment's resource once train is in the new segment
             if prev_req is not None:
@@ -107,82 +159,69 @@ class Train(Agent):
 
             # Now we get the component to shepherd us through
             try:
-                yield self.model.process(self._current_segment.component.do(self))
+                yield model.process(component.do(self))
             except Interrupt:
-                self.simLog.warn("I was interrupted!")
+                simLog.warn("I was interrupted!")
 
             # Now we handle departure times
-            if segment.departure is not None:
+            departure = segment.departure
+            if departure is not None:
                 try:
-                    wait_time = max(0, segment.departure - self.model.now)
-                    self.simLog.debug(
-                        f"Departure | Now: {self.model.now} | Schedule: {segment.departure} | Wait: {wait_time}"
-                    )
-                    if wait_time > 0:
-                        self.simLog.debug(
-                            f"Waiting for {wait_time} before departure"
+                    wait_time = max(0, departure - model.now)
+                    if debug:
+                        simLog.debug(
+                            "Departure | Now: %s | Schedule: %s | Wait: %s", model.now, departure, wait_time
                         )
-                    yield self.model.timeout(wait_time)
+                        if wait_time > 0:
+                            simLog.debug("Waiting for %s before departure", wait_time)
+                    yield model.timeout(wait_time)
                 except Interrupt:
-                    self.simLog.warn("I was interrupted!")
+                    simLog.warn("I was interrupted!")
 
             # Store the Request to be released in the next loop iteration
             prev_req = req
 
         # End of the tour - Release the agent from the last component and Release the Request from the last segment
-        self._current_segment.component.release_agent(self)
-        self.agentLog.info(
-            f"OUT,{self._current_segment.component.uid},{self._current_segment.component.__name__}"
-        )
-        self.simLog.debug(f"Finished traversing {self._current_segment.component.uid}")
-        self._current_segment.component.resource.release(prev_req)
+        component = self._current_segment.component
+        component.release_agent(self)
+        if log_agent:
+            agentLog.info(
+                f"OUT,{component.uid},{component.__name__}"
+            )
+        if debug:
+            simLog.debug("Finished traversing %s", component.uid)
+        component.resource.release(prev_req)
 
-        self.simLog.debug("Finished my tour, going idle...")
+        if debug:
+            simLog.debug("Finished my tour, going idle...")
 
     def get_basic_traversal_time(self, distance, track_speed, final_speed):
         """WARNING: NOT IMPLEMENTED"""
 
+        # Read the speed fields directly; the speeds computed below can never be negative,
+        # so the validating property setters are not needed on this path
+        speed = self._speed
         # Ajudst final requested speed based on our capabilities and allowed
-        final_speed = min(final_speed, self.max_speed, track_speed)
+        final_speed = min(final_speed, self._max_speed, track_speed)
         # Adjust the top speed we can make reach on our capabilities and allowed
-        max_speed = min(track_speed, self.max_speed)
+        max_speed = min(track_speed, self._max_speed)
 
-        self.simLog.debug(
-            f"Basic Traversal Calc: (du/step) | Current: {self.speed} | Max: {max_speed} | Final: {final_speed}"
-        )
+        debug = self.simLog.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.simLog.debug(
+                "Basic Traversal Calc: (du/step) | Current: %s | Max: %s | Final: %s", speed, max_speed, final_speed
+            )
 
-        # Let's look at some cases:
-        # If we start below the max, we'll want to accel, cruise, then decel if possible
-        accel_dist = ((max_speed * max_speed) - (self.speed * self.speed)) / (
-            2 * self.acceleration
-        )
-        decel_dist = ((max_speed * max_speed) - (final_speed * final_speed)) / (
-            2 * self.deceleration
+        time, v_peak = _traversal_kinematics(
+            distance, speed, max_speed, final_speed, self.acceleration, self.deceleration
         )
-
-        if accel_dist + decel_dist <= distance:
-            self.simLog.debug("Basic acceleration, cruise, deceleration")
-            # Simple, we just take three chunks
-            accel_time = (max_speed - self.speed) / self.acceleration
-            decel_time = (max_speed - final_speed) / self.deceleration
-            cruise_time = (distance - accel_dist - decel_dist) / max_speed
-            self.speed = final_speed
-            return accel_time + decel_time + cruise_time
-        else:
-            # Going to be an up and a down such that the sum of the two matches the distance
-            numerator = (
-                distance
-                + (self.speed**2 / (2 * self.acceleration))
-                + (final_speed**2) / (2 * self.deceleration)
-            )
-            denomenator = (1 / (2 * self.acceleration)) + (1 / (2 * self.deceleration))
-            v_peak = math.sqrt(numerator / denomenator)
-            self.simLog.debug(f"Calculated a vPeak of {v_peak:.3f} du/step")
-            time = ((v_peak - self.speed) / self.acceleration) + (
-                (v_peak - final_speed) / self.deceleration
-            )
-            self.speed = final_speed
-            return time
+        if debug:
+            if v_peak is None:
+                self.simLog.debug("Basic acceleration, cruise, deceleration")
+            else:
+                self.simLog.debug("Calculated a vPeak of %.3f du/step", v_peak)
+        self._speed = final_speed
+        return time
 
     def basic_traversal(self, distance, track_speed):
         """Perform a basic traversal of a cleared distance.
@@ -207,9 +246,10 @@ class Train(Agent):
                     next_segment.component.resource.count
                     == next_segment.component.resource.capacity
                 ):
-                    self.simLog.debug(
-                        f"Next track component ({next_segment.component.uid}) at capacity. Aiming to stop."
-                    )
+                    if self.simLog.isEnabledFor(logging.DEBUG):
+                        self.simLog.debug(
+                            "Next track component (%s) at capacity. Aiming to stop.", next_segment.component.uid
+                        )
                     final_speed = 0
                 else:
                     final_speed = next_segment.component.track_speed
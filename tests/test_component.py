@@ -0,0 +1,162 @@
+# test_component.py
+from spur.core.component import MultiBlockTrack, MultiTrackStation, TimedTrack
+
+
+class StubAgent:
+    def __init__(self, uid):
+        self.uid = uid
+
+
+def add_multi_block_line(model, num_tracks, departures):
+    """Add a yard - MultiBlockTrack - timed track - yard line with one train per (route, departure)."""
+    model.add_components_from_list([
+        {"type": "SimpleYard", "u": "0", "v": "1", "key": "Y", "args": {"capacity": 10}},
+        {"type": "MultiBlockTrack", "u": "1", "v": "2", "key": "T",
+         "args": {"num_tracks": num_tracks, "num_blocks": 3, "traversal_time": 30}},
+        {"type": "TimedTrack", "u": "2", "v": "3", "key": "E", "args": {"traversal_time": 100}},
+        {"type": "TimedTrack", "u": "2", "v": "3", "key": "W", "args": {"traversal_time": 10}},
+        {"type": "SimpleYard", "u": "3", "v": "4", "key": "Y", "args": {"capacity": 10}},
+    ])
+    segments = {
+        "E": [("0", "1", "Y"), ("1", "2", "T"), ("2", "3", "E"), ("3", "4", "Y")],
+        "W": [("3", "4", "Y"), ("2", "3", "W"), ("1", "2", "T"), ("0", "1", "Y")],
+    }
+    routes = [
+        {"name": name, "components": [{"u": u, "v": v, "key": key} for u, v, key in s]}
+        for name, s in segments.items()
+    ]
+    tours = [
+        {"name": f"T{i}", "creation_time": 0, "deletion_time": 9999,
+         "routes": [{"name": route, "args": [{"departure": departure}, None, None, None]}]}
+        for i, (route, departure) in enumerate(departures)
+    ]
+    model.add_routes_and_tours_from_lists(routes, tours)
+    model.add_trains_from_list([{"name": f"t{i}", "max_speed": 20, "tour": f"T{i}"} for i in range(len(departures))])
+    return model.component_dictionary()["1-2-T"]["c"]
+
+
+def block_uids(track):
+    return [train.uid if train is not None else None for train in track._blocks]
+
+
+class GatedTrack(TimedTrack):
+    """A timed track that only accepts agents while open."""
+
+    __slots__ = ("open",)
+
+    def can_accept_agent(self, agent) -> bool:
+        return self.open
+
+
+def test_as_dict_repeatable(toy_model_base):
+    track = toy_model_base.add_component(TimedTrack, "1", "2", "A", traversal_time=5)
+    expected = {
+        "type": "TimedTrack",
+        "uid": "1-2-A",
+        "jitter": "NoJitter",
+        "args": {"traversal_time": 5, "capacity": 1},
+    }
+    assert track.as_dict() == expected
+    assert track.as_dict() == expected
+    assert track.resource.capacity == 1
+
+
+def test_as_dict_multi_block_track(toy_model_base):
+    track = toy_model_base.add_component(
+        MultiBlockTrack, "1", "2", "A", num_tracks=2, num_blocks=3, traversal_time=30
+    )
+    assert track.as_dict()["args"] == {"num_tracks": 2, "num_blocks": 3, "traversal_time": 30}
+
+
+def test_as_dict_multi_track_station(toy_model_base):
+    args = {
+        "num_stopping_tracks": 2,
+        "num_bypass_tracks": 1,
+        "bypass_time": 5,
+        "dwell_c": 3.0,
+        "dwell_d": 1.5,
+        "dwell_loc": 10.0,
+        "dwell_scale": 20.0,
+    }
+    station = toy_model_base.add_component(MultiTrackStation, "1", "2", "S", **args)
+    assert station.as_dict()["args"] == args
+
+
+def test_process_queue_admits_every_eligible_waiter(toy_model_base):
+    track = toy_model_base.add_component(GatedTrack, "1", "2", "G", traversal_time=5, capacity=2)
+    track.open = False
+    requests = [track.resource.request(StubAgent(f"t{i}")) for i in range(3)]
+    assert not any(r.triggered for r in requests)
+
+    # Both waiters that now fit get in on one call, in queue order; the third exceeds capacity
+    track.open = True
+    track.resource.process_queue()
+    assert [r.triggered for r in requests] == [True, True, False]
+
+
+def test_multi_block_track_following(toy_model_base):
+    track = add_multi_block_line(toy_model_base, 1, [("E", 0), ("E", 0), ("E", 0)])
+    toy_model_base.start()
+
+    # Trains follow each other in block by block as the block ahead clears
+    toy_model_base.run(until=25)
+    assert block_uids(track) == ["t2", "t1", "t0"]
+
+    # t1 holds the last block until the timed track ahead is free; t2 waits behind it
+    toy_model_base.run(until=50)
+    assert block_uids(track) == [None, "t2", "t1"]
+    assert track._block_waiting[1] is not None
+
+    toy_model_base.run(until=140)
+    assert block_uids(track) == [None, None, "t2"]
+    assert track._block_waiting == [None, None, None]
+
+
+def test_multi_block_track_direction_reset(toy_model_base):
+    track = add_multi_block_line(toy_model_base, 1, [("E", 0), ("E", 0)])
+    toy_model_base.start()
+    toy_model_base.run(until=15)
+    assert track._track_directions == [1]
+
+    # Once the last train leaves, the track can be used in either direction again
+    toy_model_base.run(until=1000)
+    assert block_uids(track) == [None, None, None]
+    assert track._track_directions == [None]
+    assert track._track_occupancy == [0]
+
+
+def test_multi_block_track_rejects_opposite_direction(toy_model_base):
+    track = add_multi_block_line(toy_model_base, 1, [("E", 0), ("W", 0)])
+    west = toy_model_base.trains["t1"]
+    toy_model_base.start()
+
+    # The westbound train reaches the track while the eastbound one is still on it
+    toy_model_base.run(until=15)
+    assert track._track_directions == [1]
+    assert not track.can_accept_agent(west)
+    assert [request.agent for request in track.resource.put_queue] == [west]
+
+    # It gets in once the track has emptied
+    toy_model_base.run(until=35)
+    assert track._track_directions == [-1]
+    assert block_uids(track) == [None, None, "t1"]
+
+
+def test_multi_block_track_accept_reuses_admission(toy_model_base, monkeypatch):
+    assigned = []
+    assign_track = MultiBlockTrack._assign_track
+
+    def recording_assign_track(self, direction):
+        t = assign_track(self, direction)
+        assigned.append(t)
+        return t
+
+    monkeypatch.setattr(MultiBlockTrack, "_assign_track", recording_assign_track)
+    track = add_multi_block_line(toy_model_base, 2, [("E", 0), ("W", 0)])
+    toy_model_base.start()
+    toy_model_base.run(until=15)
+
+    # Each train was checked and accepted once, and the track was only chosen in the check
+    assert assigned == [0, 1]
+    assert block_uids(track) == [None, "t0", None, None, None, "t1"]
+    assert track._admission is None
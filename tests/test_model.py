@@ -1,6 +1,9 @@
 # test_spur.py
+import logging
+
 from spur import __version__
 from spur.core import Model
+from spur.core.component import PhysicsTrack
 from spur.core.route import Route
 from spur.core.exception import NotUniqueIDError
 
@@ -23,3 +26,46 @@ def test_not_unique_train_id(toy_model_with_components):
     with pytest.raises(NotUniqueIDError):
         toy_model_with_components.add_train(1, 20, r)
         toy_model_with_components.add_train(1, 20, r)
+
+
+def test_not_unique_component_id(toy_model_with_components):
+    with pytest.raises(NotUniqueIDError):
+        toy_model_with_components.add_component(
+            PhysicsTrack, "1", "2", "A", length=80, track_speed=25
+        )
+
+
+def test_component_dictionary_sees_new_components(toy_model_with_components):
+    assert len(toy_model_with_components.component_dictionary()) == 3
+    toy_model_with_components.add_component(PhysicsTrack, "4", "5", "A", length=80, track_speed=25)
+    assert toy_model_with_components.component_dictionary()["4-5-A"]["u"] == "4"
+
+
+def test_agent_log_handler_not_added_per_train(toy_model_with_components):
+    agent_log = logging.getLogger("agent")
+    n_handlers = len(agent_log.handlers)
+    r = Route()
+    r.append(toy_model_with_components.components[0])
+    r.append(toy_model_with_components.components[1])
+    toy_model_with_components.add_train(1, 20, r)
+    toy_model_with_components.add_train(2, 20, r)
+    assert len(agent_log.handlers) == n_handlers
+
+
+def test_agent_log_handler_replaced_per_model():
+    Model()
+    Model()
+    agent_log = logging.getLogger("agent")
+    assert len([h for h in agent_log.handlers if isinstance(h, logging.FileHandler)]) == 1
+
+
+def test_agent_log_disabled():
+    Model(agent_log=False)
+    agent_log = logging.getLogger("agent")
+    assert not [h for h in agent_log.handlers if isinstance(h, logging.FileHandler)]
+
+
+def test_positional_initial_time():
+    model = Model(False, 50)
+    assert model.now == 50
+    assert model.agent_log